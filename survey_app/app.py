@@ -1,4 +1,8 @@
+import asyncio
+import json
+import logging
 import math
+from functools import lru_cache, partial
 from pathlib import Path
 from typing import Optional, Tuple, List
 
@@ -6,38 +10,398 @@ import toga
 from toga.style import Pack
 from toga.style.pack import COLUMN, CENTER, ROW
 
-try:
-    from PIL import Image, ImageDraw, ImageFont
-    PILLOW_AVAILABLE = True
-except ImportError:
-    PILLOW_AVAILABLE = False
+# Pillow is only needed for the TruthWeb graph; deferring its import keeps
+# the native-lib/font-loader cost off the app startup path
+PILLOW_AVAILABLE: Optional[bool] = None
+Image = ImageDraw = ImageFont = None
 
-from .questions import QUESTION_SETS
-from .storage import load_answers, save_answers
+
+def _load_pillow() -> bool:
+    """Import Pillow on first use and record whether it is available."""
+    global PILLOW_AVAILABLE, Image, ImageDraw, ImageFont
+    if PILLOW_AVAILABLE is None:
+        try:
+            from PIL import Image, ImageDraw, ImageFont
+            PILLOW_AVAILABLE = True
+        except ImportError:
+            PILLOW_AVAILABLE = False
+    return PILLOW_AVAILABLE
+
+
+@lru_cache(maxsize=1)
+def _graph_fonts():
+    """Load the graph label fonts once per process; each truetype() call
+    reopens and reparses the font file otherwise. Requires _load_pillow().
+    Falls back to Pillow's built-in default, then to None."""
+    try:
+        font = ImageFont.truetype("Arial.ttf", 16)
+        bold_font = ImageFont.truetype("Arial Bold.ttf", 16)
+    except Exception:
+        try:
+            font = ImageFont.load_default()
+            bold_font = font
+        except Exception:
+            font = None
+            bold_font = None
+    return font, bold_font
+
+from .questions import QUESTION_SETS, QUESTION_SETS_SOA
+from .storage import load_answers, load_responses, save_answers
+
+logger = logging.getLogger(__name__)
+
+# Cached numeric labels so "Q3"/"Question 3" aren't re-formatted per render
+_Q_LABEL_CACHE: list[str] = []
+_QUESTION_LABEL_CACHE: list[str] = []
+
+# Static HTML/JS for the interactive TruthWeb graph; only the four JSON
+# blobs vary per render
+_GRAPH_HTML = """<!DOCTYPE html>
+<html>
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>TruthWeb</title>
+    <style>
+        * { margin: 0; padding: 0; box-sizing: border-box; }
+        body { margin: 0; padding: 8px; background: white; font-family: Arial, sans-serif; }
+        #canvasContainer { text-align: center; margin: 8px 0; }
+        canvas { border: 1px solid #ddd; max-width: 100%; height: auto; display: block; margin: 0 auto; }
+        #info { padding: 12px; background: #f0f0f0; margin-top: 8px; border-radius: 4px; font-size: 14px; min-height: 60px; line-height: 1.5; }
+        #info strong { color: #333; display: block; margin-bottom: 4px; }
+    </style>
+</head>
+<body>
+    <div id="canvasContainer">
+        <canvas id="graphCanvas" width="600" height="600"></canvas>
+    </div>
+    <div id="info">Tap a node (Q1-Q10) on the graph above to see question details</div>
+    <script>
+        const canvas = document.getElementById('graphCanvas');
+        const ctx = canvas.getContext('2d');
+        const info = document.getElementById('info');
+        
+        const questions = ${questions_js};
+        // Struct-of-arrays payload: x/y positions plus answered (a) and
+        // agreed (g) flags, all indexed by question number
+        const nodes = ${nodes_js};
+        const contradictions = ${contradictions_js};
+        const requirements = ${requirements_js};
+        const numNodes = nodes.x.length;
+        
+        const width = 600;
+        const height = 600;
+        const nodeRadius = 30;
+        
+        function drawGraph() {
+            // Clear canvas
+            ctx.fillStyle = 'white';
+            ctx.fillRect(0, 0, width, height);
+            
+            // Draw connections first (so they appear behind nodes)
+            // Draw contradictions in red
+            contradictions.forEach(([i, j]) => {
+                if (i < numNodes && j < numNodes) {
+                    ctx.strokeStyle = '#d32f2f';
+                    ctx.lineWidth = 4;
+                    ctx.beginPath();
+                    ctx.moveTo(nodes.x[i], nodes.y[i]);
+                    ctx.lineTo(nodes.x[j], nodes.y[j]);
+                    ctx.stroke();
+                }
+            });
+            
+            // Draw requirements in green
+            requirements.forEach(([i, j]) => {
+                if (i < numNodes && j < numNodes) {
+                    ctx.strokeStyle = '#388e3c';
+                    ctx.lineWidth = 4;
+                    ctx.beginPath();
+                    ctx.moveTo(nodes.x[i], nodes.y[i]);
+                    ctx.lineTo(nodes.x[j], nodes.y[j]);
+                    ctx.stroke();
+                }
+            });
+            
+            // Draw nodes
+            for (let i = 0; i < numNodes; i++) {
+                let fillColor = '#e0e0e0';  // Light gray for unanswered
+                let strokeColor = '#999999';
+                if (nodes.a[i]) {
+                    if (nodes.g[i]) {
+                        fillColor = '#4a90e2';  // Blue for agreed
+                        strokeColor = '#2d5aa0';
+                    } else {
+                        fillColor = '#cccccc';  // Gray for disagreed
+                        strokeColor = '#888888';
+                    }
+                }
+                
+                // Draw circle
+                ctx.fillStyle = fillColor;
+                ctx.strokeStyle = strokeColor;
+                ctx.lineWidth = 3;
+                ctx.beginPath();
+                ctx.arc(nodes.x[i], nodes.y[i], nodeRadius, 0, 2 * Math.PI);
+                ctx.fill();
+                ctx.stroke();
+                
+                // Draw question number
+                ctx.fillStyle = 'white';
+                ctx.font = 'bold 16px Arial';
+                ctx.textAlign = 'center';
+                ctx.textBaseline = 'middle';
+                ctx.fillText('Q' + (i + 1), nodes.x[i], nodes.y[i]);
+            }
+        }
+        
+        // Handle clicks and touches
+        function getCanvasCoordinates(e) {
+            const rect = canvas.getBoundingClientRect();
+            const scaleX = canvas.width / rect.width;
+            const scaleY = canvas.height / rect.height;
+            
+            let clientX, clientY;
+            if (e.touches && e.touches.length > 0) {
+                // Touch event
+                clientX = e.touches[0].clientX;
+                clientY = e.touches[0].clientY;
+            } else if (e.changedTouches && e.changedTouches.length > 0) {
+                // Touch end event
+                clientX = e.changedTouches[0].clientX;
+                clientY = e.changedTouches[0].clientY;
+            } else {
+                // Mouse/click event
+                clientX = e.clientX;
+                clientY = e.clientY;
+            }
+            
+            const x = (clientX - rect.left) * scaleX;
+            const y = (clientY - rect.top) * scaleY;
+            return {x: x, y: y};
+        }
+        
+        function handleInteraction(e) {
+            e.preventDefault();
+            e.stopPropagation();
+            
+            const coords = getCanvasCoordinates(e);
+            const x = coords.x;
+            const y = coords.y;
+            
+            // Find which node was clicked
+            for (let i = 0; i < numNodes; i++) {
+                const dx = x - nodes.x[i];
+                const dy = y - nodes.y[i];
+                const distance = Math.sqrt(dx * dx + dy * dy);
+                
+                if (distance <= nodeRadius + 5) {
+                    const answerText = nodes.a[i] ? (nodes.g[i] ? 'Agree' : 'Disagree') : 'Not answered';
+                    const questionText = questions[i];
+                    const qNum = i + 1;
+                    
+                    // Update info display
+                    info.innerHTML = '<strong>Question ' + qNum + ':</strong>' + 
+                                   '<br>' + questionText + 
+                                   '<br><br><strong>Your Answer:</strong> ' + answerText;
+                    
+                    // Show alert as well for visibility
+                    setTimeout(function() {
+                        alert('Question ' + qNum + ':\\n\\n' + questionText + '\\n\\nYour Answer: ' + answerText);
+                    }, 50);
+                    break;
+                }
+            }
+        }
+        
+        canvas.addEventListener('click', handleInteraction);
+        canvas.addEventListener('touchend', handleInteraction);
+        canvas.addEventListener('touchstart', function(e) { e.preventDefault(); });
+        
+        // Initial draw
+        drawGraph();
+    </script>
+</body>
+</html>"""
+
+def _split_at_markers(body: str, markers: tuple[str, ...]) -> tuple[str, ...]:
+    """Split the template into the static slices around each marker, in
+    order, so rendering is a single str.join with the dynamic JSON blobs
+    interleaved — no placeholder rescan per render."""
+    slices = []
+    for marker in markers:
+        head, _, body = body.partition(marker)
+        slices.append(head)
+    slices.append(body)
+    return tuple(slices)
+
+
+_GRAPH_HTML_SLICES = _split_at_markers(
+    _GRAPH_HTML,
+    ("${questions_js}", "${nodes_js}", "${contradictions_js}", "${requirements_js}"),
+)
+
+
+# Status (glyph, answer text) pairs indexed by the same state coding as
+# _NODE_COLORS below: 0 = unanswered, 1 = disagreed, 2 = agreed
+_STATUS = (
+    ("⚪", "Not answered"),
+    ("⚪", "Disagree"),
+    ("🔵", "Agree"),
+)
+
+# Node (fill, outline) colours for the PNG graph, indexed by state:
+# 0 = unanswered (light gray), 1 = disagreed (gray), 2 = agreed (blue)
+_NODE_COLORS = (
+    ((224, 224, 224), (153, 153, 153)),  # #e0e0e0 / #999999
+    ((204, 204, 204), (136, 136, 136)),  # #cccccc / #888888
+    ((74, 144, 226), (45, 90, 160)),     # #4a90e2 / #2d5aa0
+)
+
+
+@lru_cache(maxsize=8)
+def _circle_positions(num_nodes: int, center_x: float, center_y: float,
+                      radius: float) -> tuple[tuple[float, float], ...]:
+    """Node centres evenly spaced on a circle, starting at 12 o'clock.
+    Memoised so the trig runs once per distinct layout, not per render."""
+    return tuple(
+        (
+            center_x + radius * math.cos(2 * math.pi * i / num_nodes - math.pi / 2),
+            center_y + radius * math.sin(2 * math.pi * i / num_nodes - math.pi / 2),
+        )
+        for i in range(num_nodes)
+    )
+
+
+@lru_cache(maxsize=8)
+def _canvas_positions(num_nodes: int) -> tuple[tuple[float, float], ...]:
+    """The circle layout pre-scaled from the 800x800 graph space to the
+    600x600 HTML canvas, so the per-node multiply runs once per layout."""
+    return tuple(
+        (x * 0.75, y * 0.75)
+        for x, y in _circle_positions(num_nodes, 400, 400, 800 * 0.35)
+    )
+
+
+def q_label(index: int) -> str:
+    """Cached "Q<n>" label for a 0-based question index."""
+    while len(_Q_LABEL_CACHE) <= index:
+        _Q_LABEL_CACHE.append(f"Q{len(_Q_LABEL_CACHE) + 1}")
+    return _Q_LABEL_CACHE[index]
+
+
+def question_label(index: int) -> str:
+    """Cached "Question <n>" label for a 0-based question index."""
+    while len(_QUESTION_LABEL_CACHE) <= index:
+        _QUESTION_LABEL_CACHE.append(f"Question {len(_QUESTION_LABEL_CACHE) + 1}")
+    return _QUESTION_LABEL_CACHE[index]
 
 
 class SurveyController:
+    # Home-screen status probe cache: question_set_name -> (file mtime, status)
+    _status_cache: dict[str, tuple[float, str]] = {}
+
     def __init__(self, app: "SurveyApp", question_set_name: str) -> None:
         self.app = app
         self.question_set_name = question_set_name
         self.question_set = QUESTION_SETS[question_set_name]
-        self.answers = load_answers(self.responses_path)
-        self.current_index = self._compute_next_index()
+        # Struct-of-arrays view: parallel tuples sidestep per-access dict
+        # hashing in the hot loops below
+        soa = QUESTION_SETS_SOA[question_set_name]
+        self.texts = soa.texts
+        self.contradicts = soa.contradicts
+        self.requires = soa.requires
+        # Use set-specific filename; built once, the property just returns it
+        self._responses_path = app.paths.data / f"responses_{question_set_name}.json"
+        # Answer keys are pure functions of the index; format them once
+        self._keys = tuple(f"q{i + 1}" for i in range(len(self.question_set)))
+        # Truncated question texts for button labels, computed once per set
+        self._short_texts = tuple(
+            text[:50] + "..." if len(text) > 50 else text
+            for text in self.texts
+        )
+        self.answers, stored_next = load_responses(self.responses_path)
+        if stored_next is not None and 0 <= stored_next <= len(self.question_set):
+            self.current_index = stored_next
+        else:
+            # Legacy or tampered file: scan once and persist the index so
+            # the next construction is O(1)
+            self.current_index = self._compute_next_index()
+            if self.answers:
+                save_answers(self.responses_path, self.answers, self.current_index)
+        # Detection results are cached until an answer changes
+        self._contradictions_cache: Optional[list[tuple[int, int, str, str]]] = None
+        self._requirements_cache: Optional[list[tuple[int, int, str, str]]] = None
+        # Bumped on every answer mutation; used to memoise derived UI data
+        self._answers_version = 0
+        self._button_labels_cache: Optional[tuple[int, list[str]]] = None
+        # Debounced persistence: answers are written at most once per burst
+        # of taps, plus on explicit flush points (screen transitions, exit)
+        self._dirty = False
+        self._flush_handle: Optional[asyncio.TimerHandle] = None
+        # Flat edge pairs are computed once at import in questions.py;
+        # detection is a plain filter over them
+        self._contradict_edges = soa.contradict_pairs
+        self._require_edges = soa.require_pairs
+        # Question texts never change within a session, so their JSON blob
+        # for the interactive TruthWeb HTML is serialised once here
+        self._questions_js = json.dumps(list(self.texts), ensure_ascii=False)
 
     @property
     def responses_path(self) -> Path:
-        # Use set-specific filename
-        return self.app.paths.data / f"responses_{self.question_set_name}.json"
+        return self._responses_path
+
+    @classmethod
+    def status_for(cls, app: "SurveyApp", question_set_name: str) -> str:
+        """
+        Status of a question set without constructing a controller:
+        'not_started', 'in_progress', or 'completed'.
+
+        The active controller answers from memory; other sets are probed by
+        stat()ing their responses file and the JSON is only re-parsed when
+        the file's mtime changes.
+        """
+        controller = app.controller
+        if controller is not None and controller.question_set_name == question_set_name:
+            if len(controller.answers) == 0:
+                return "not_started"
+            return "completed" if controller.is_complete() else "in_progress"
+
+        path = app.paths.data / f"responses_{question_set_name}.json"
+        try:
+            mtime = path.stat().st_mtime
+        except OSError:
+            return "not_started"
+
+        cached = cls._status_cache.get(question_set_name)
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
+
+        answers = load_answers(path)
+        question_set = QUESTION_SETS[question_set_name]
+        if len(answers) == 0:
+            status = "not_started"
+        elif all(f"q{i + 1}" in answers for i in range(len(question_set))):
+            status = "completed"
+        else:
+            status = "in_progress"
+        cls._status_cache[question_set_name] = (mtime, status)
+        return status
 
     def _compute_next_index(self) -> int:
         for i in range(len(self.question_set)):
-            key = self._key_for(i)
+            key = self._keys[i]
             if key not in self.answers:
                 return i
         return len(self.question_set)
 
+    @property
+    def keys(self) -> tuple:
+        """Answer-dict key per question index, precomputed at init."""
+        return self._keys
+
     def _key_for(self, index: int) -> str:
-        return f"q{index + 1}"
+        return self._keys[index]
 
     def is_complete(self) -> bool:
         return self.current_index >= len(self.question_set)
@@ -45,17 +409,125 @@ class SurveyController:
     def record_answer(self, value: bool) -> None:
         if self.is_complete():
             return
-        key = self._key_for(self.current_index)
-        question_data = self.question_set[self.current_index]
-        question_text = question_data["text"]
-        self.answers[key] = [question_text, value]
-        save_answers(self.responses_path, self.answers)
+        key = self._keys[self.current_index]
+        self.answers[key] = [self.texts[self.current_index], value]
         self.current_index += 1
+        self.schedule_save()
+        self.invalidate_detection_caches()
 
     def restart(self) -> None:
         self.answers = {}
-        save_answers(self.responses_path, self.answers)
+        # Restarting clears the file immediately; drop any pending flush
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        self._dirty = False
         self.current_index = 0
+        save_answers(self.responses_path, self.answers, self.current_index)
+        self.invalidate_detection_caches()
+
+    def schedule_save(self) -> None:
+        """Mark answers dirty and debounce the disk write, coalescing a
+        burst of taps into a single save."""
+        self._dirty = True
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            # No event loop (e.g. during tests); save synchronously
+            self.flush()
+            return
+        self._flush_handle = loop.call_later(0.5, self.flush)
+
+    def flush(self) -> None:
+        """Write pending answers to disk, if any."""
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        if not self._dirty:
+            return
+        self._dirty = False
+        save_answers(self.responses_path, self.answers, self.current_index)
+
+    def invalidate_detection_caches(self) -> None:
+        """Drop cached detection results after any answer mutation."""
+        self._contradictions_cache = None
+        self._requirements_cache = None
+        self._answers_version += 1
+
+    def button_labels(self) -> list[str]:
+        """
+        Truth-web button labels per question ("<glyph> Q<n>"). Memoised on
+        the answers version so repeat renders reuse the formatted strings.
+        """
+        cached = self._button_labels_cache
+        if cached is not None and cached[0] == self._answers_version:
+            return cached[1]
+
+        answers = self.answers
+        labels = []
+        for i, key in enumerate(self._keys):
+            entry = answers.get(key)
+            state = 0 if entry is None else (2 if entry[1] else 1)
+            labels.append(f"{_STATUS[state][0]} {q_label(i)}")
+
+        self._button_labels_cache = (self._answers_version, labels)
+        return labels
+
+    def _agreed_flags(self) -> list[bool]:
+        """One pass over the answers dict: agreed[i] is True iff question i
+        was answered "Agree". Lets the detectors scan integer indices only."""
+        answers = self.answers
+        agreed = [False] * len(self.question_set)
+        for i, key in enumerate(self._keys):
+            entry = answers.get(key)
+            if entry is not None:
+                agreed[i] = bool(entry[1])
+        return agreed
+
+    def answer_flags(self) -> tuple[list[bool], list[bool]]:
+        """Parallel answered/agreed flag lists filled in a single pass,
+        for renderers that need both (one dict lookup per question)."""
+        answers = self.answers
+        n = len(self.question_set)
+        answered = [False] * n
+        agreed = [False] * n
+        for i, key in enumerate(self._keys):
+            entry = answers.get(key)
+            if entry is not None:
+                answered[i] = True
+                agreed[i] = bool(entry[1])
+        return answered, agreed
+
+    def analyze(self) -> tuple[list[tuple[int, int, str, str]], list[tuple[int, int, str, str]]]:
+        """
+        Detect contradictions and requirements in one shared pass.
+        Both relationships gate on the same agreed flags, so the answers
+        dict is scanned once and both edge sets are filled together.
+        Results are cached until an answer changes.
+        """
+        if self._contradictions_cache is not None and self._requirements_cache is not None:
+            return self._contradictions_cache, self._requirements_cache
+
+        texts = self.texts
+        agreed = self._agreed_flags()
+
+        contradictions = []
+        for i, j in self._contradict_edges:
+            # A contradiction needs "Agree" on both sides
+            if agreed[i] and agreed[j]:
+                contradictions.append((i, j, texts[i], texts[j]))
+
+        requirements = []
+        for i, j in self._require_edges:
+            if agreed[i] and agreed[j]:
+                requirements.append((i, j, texts[i], texts[j]))
+
+        self._contradictions_cache = contradictions
+        self._requirements_cache = requirements
+        return contradictions, requirements
 
     def detect_contradictions(self) -> list[tuple[int, int, str, str]]:
         """
@@ -63,31 +535,9 @@ class SurveyController:
         Two questions contradict if:
         - They are in each other's contradicts list
         - Both were answered "Agree" (True)
+        Each contradicting pair is reported once, with q1_index < q2_index.
         """
-        contradictions = []
-        for i in range(len(self.question_set)):
-            key_i = self._key_for(i)
-            if key_i not in self.answers:
-                continue
-            
-            question_i = self.question_set[i]
-            answer_i = self.answers[key_i][1]  # boolean value
-            
-            # Check contradictions listed in this question
-            for j in question_i["contradicts"]:
-                key_j = self._key_for(j)
-                if key_j not in self.answers:
-                    continue
-                
-                answer_j = self.answers[key_j][1]
-                question_j = self.question_set[j]
-                
-                # If both are agreed with, that's a contradiction
-                # (Both can't be true if they contradict)
-                if answer_i and answer_j:
-                    contradictions.append((i, j, question_i["text"], question_j["text"]))
-        
-        return contradictions
+        return self.analyze()[0]
 
     def detect_requirements(self) -> list[tuple[int, int, str, str]]:
         """
@@ -96,29 +546,7 @@ class SurveyController:
         - Question i requires question j in its "requires" list
         - Both were answered "Agree" (True)
         """
-        requirements = []
-        for i in range(len(self.question_set)):
-            key_i = self._key_for(i)
-            if key_i not in self.answers:
-                continue
-            
-            question_i = self.question_set[i]
-            answer_i = self.answers[key_i][1]  # boolean value
-            
-            # Check requirements listed in this question
-            for j in question_i["requires"]:
-                key_j = self._key_for(j)
-                if key_j not in self.answers:
-                    continue
-                
-                answer_j = self.answers[key_j][1]
-                question_j = self.question_set[j]
-                
-                # If both are agreed with, that's a valid requirement relationship
-                if answer_i and answer_j:
-                    requirements.append((i, j, question_i["text"], question_j["text"]))
-        
-        return requirements
+        return self.analyze()[1]
 
 
 class SurveyApp(toga.App):
@@ -133,17 +561,59 @@ class SurveyApp(toga.App):
         self.contradictions_to_resolve: list[tuple[int, int, str, str]] = []  # Store contradictions to resolve
         self.selected_question_to_change: Optional[int] = None  # Track which question user wants to change
 
+        # Cached screens: built once, only their dynamic widgets are
+        # mutated on later renders (widget construction is the expensive
+        # part of a redraw on mobile backends)
+        self._question_screen: Optional[toga.Box] = None
+        self._question_progress_label: Optional[toga.Label] = None
+        self._question_text_label: Optional[toga.Label] = None
+        self._results_screen: Optional[toga.Box] = None
+        self._results_table: Optional[toga.Table] = None
+        self._results_dynamic_box: Optional[toga.Box] = None
+        self._results_contradictions_label: Optional[toga.Label] = None
+        self._results_contradictions_view: Optional[toga.MultilineTextInput] = None
+        self._results_ok_label: Optional[toga.Label] = None
+        self._change_answer_screen: Optional[toga.Box] = None
+        self._change_answer_header_label: Optional[toga.Label] = None
+        self._change_answer_question_label: Optional[toga.Label] = None
+        self._change_answer_current_label: Optional[toga.Label] = None
+
+        # Graph image cache: regenerating the PNG is the most expensive
+        # operation in the app, so reuse it while answers are unchanged
+        self._graph_cache_key: Optional[tuple] = None
+        self._graph_cache_result: Optional[Tuple[Path, List[Tuple[float, float]]]] = None
+        # Interactive HTML cache: (state key, file mtime at last write), so a
+        # manual edit of the file on disk also invalidates
+        self._html_cache_key: Optional[tuple] = None
+        self._html_cache_mtime: Optional[float] = None
+        self._truth_web_html_path = self.paths.data / 'truthweb_interactive.html'
+        # Live WebView reuse: while the loaded page's question set and edge
+        # sets still match, answer toggles are patched into the canvas with
+        # a small evaluate_javascript call instead of a reload
+        self._truth_web_webview: Optional[toga.WebView] = None
+        self._graph_edges_key: Optional[tuple] = None
+        self._webview_state_key: Optional[tuple] = None
+
         self.main_window = toga.MainWindow(title=self.formal_name)
         self._show_current_screen()
         self.main_window.show()
 
     # UI builders
     def _show_current_screen(self) -> None:
-        print(f"DEBUG _show_current_screen: on_home={self.on_home_screen}, controller={self.controller is not None}, resolving={self.resolving_contradictions}, showing_truth_web={self.showing_truth_web}, complete={self.controller.is_complete() if self.controller else False}")
+        if logger.isEnabledFor(logging.DEBUG):
+            # Guarded so the f-string (and is_complete call) cost nothing in production
+            logger.debug(
+                "_show_current_screen: on_home=%s, controller=%s, resolving=%s, showing_truth_web=%s, complete=%s",
+                self.on_home_screen,
+                self.controller is not None,
+                self.resolving_contradictions,
+                self.showing_truth_web,
+                self.controller.is_complete() if self.controller else False,
+            )
         if self.on_home_screen or self.controller is None:
             self.main_window.content = self._build_home_screen()
         elif self.resolving_contradictions:
-            print("DEBUG: Showing contradiction resolution screen")
+            logger.debug("Showing contradiction resolution screen")
             if self.selected_question_to_change is not None:
                 # Show the question to change answer
                 self.main_window.content = self._build_change_answer_screen()
@@ -158,17 +628,47 @@ class SurveyApp(toga.App):
         else:
             self.showing_truth_web = False  # Reset when not complete
             self.main_window.content = self._build_question_screen()
-    
+
+    # Direct navigation helpers: event handlers know their target screen, so
+    # they skip the _show_current_screen flag dispatch and set the content
+    # in one step. _show_current_screen remains for the initial paint.
+    def _go_home(self) -> None:
+        self.on_home_screen = True
+        self.main_window.content = self._build_home_screen()
+
+    def _go_question(self) -> None:
+        self.on_home_screen = False
+        self.showing_truth_web = False
+        self.main_window.content = self._build_question_screen()
+
+    def _go_results(self) -> None:
+        self.on_home_screen = False
+        self.showing_truth_web = False
+        self.main_window.content = self._build_results_screen()
+
+    def _go_truth_web(self) -> None:
+        self.on_home_screen = False
+        self.showing_truth_web = True
+        self.main_window.content = self._build_truth_web_screen()
+
+    def _go_survey(self) -> None:
+        """Question screen while in progress, results once complete"""
+        if self.controller is not None and self.controller.is_complete():
+            self._go_results()
+        else:
+            self._go_question()
+
+    def _go_resolution(self) -> None:
+        self.on_home_screen = False
+        self.showing_truth_web = False
+        if self.selected_question_to_change is not None:
+            self.main_window.content = self._build_change_answer_screen()
+        else:
+            self.main_window.content = self._build_contradiction_resolution_screen()
+
     def _get_question_set_status(self, question_set_name: str) -> str:
         """Get status of a question set: 'not_started', 'in_progress', or 'completed'"""
-        # Create a temporary controller to check status
-        temp_controller = SurveyController(self, question_set_name)
-        if len(temp_controller.answers) == 0:
-            return "not_started"
-        elif temp_controller.is_complete():
-            return "completed"
-        else:
-            return "in_progress"
+        return SurveyController.status_for(self, question_set_name)
     
     def _build_home_screen(self) -> toga.Box:
         """Build the home/welcome screen with question set selection"""
@@ -181,10 +681,12 @@ class SurveyApp(toga.App):
         )
         root.add(title)
         
-        # Question set selection buttons
-        button_container = toga.Box(style=Pack(direction=COLUMN, padding_top=16))
-        
-        # Create buttons for each question set
+        # Question set selection buttons; collect them first and hand the
+        # whole list to the Box so the layout pass runs once, not per add.
+        # One shared style instance serves every button (Toga copies styles
+        # on assignment, so sharing the prototype is safe).
+        set_btn_style = Pack(padding=12, width=200, margin_bottom=8)
+        set_buttons = []
         for set_name in QUESTION_SETS.keys():
             status = self._get_question_set_status(set_name)
             
@@ -196,20 +698,36 @@ class SurveyApp(toga.App):
             else:  # completed
                 button_text = f"{set_name} (Review)"
             
-            def make_handler(name: str):
-                return lambda widget: self._on_select_question_set(name)
-            
-            set_btn = toga.Button(
+            set_buttons.append(toga.Button(
                 button_text,
-                style=Pack(padding=12, width=200, margin_bottom=8),
-                on_press=make_handler(set_name)
-            )
-            button_container.add(set_btn)
+                style=set_btn_style,
+                on_press=partial(self._on_question_set_pressed, set_name)
+            ))
         
+        button_container = toga.Box(
+            style=Pack(direction=COLUMN, padding_top=16),
+            children=set_buttons
+        )
         root.add(button_container)
         
         return root
     
+    def _on_question_set_pressed(self, question_set_name: str, widget: toga.Widget) -> None:
+        """Button adapter: drops the widget argument supplied by Toga"""
+        self._on_select_question_set(question_set_name)
+
+    def _on_question_btn_pressed(self, question_index: int, widget: toga.Widget) -> None:
+        """Button adapter: drops the widget argument supplied by Toga"""
+        self._on_question_click(question_index)
+
+    def _on_answer_pressed(self, value: bool, widget: toga.Widget) -> None:
+        """Button adapter: drops the widget argument supplied by Toga"""
+        self._on_answer(value)
+
+    def _on_change_question_pressed(self, question_index: int, widget: toga.Widget) -> None:
+        """Button adapter: drops the widget argument supplied by Toga"""
+        self._on_select_question_to_change(question_index)
+
     def _on_select_question_set(self, question_set_name: str) -> None:
         """Handle question set selection from home screen"""
         self.selected_question_set = question_set_name
@@ -217,7 +735,7 @@ class SurveyApp(toga.App):
         self.on_home_screen = False
         self.survey_started = True
         self.showing_truth_web = False
-        self._show_current_screen()
+        self._go_survey()
     
     def _on_start_survey(self, widget: Optional[toga.Widget]) -> None:
         """Start the survey from home screen (deprecated - use _on_select_question_set)"""
@@ -227,42 +745,45 @@ class SurveyApp(toga.App):
     
     def _on_continue_survey(self, widget: Optional[toga.Widget]) -> None:
         """Continue existing survey"""
-        self.on_home_screen = False
         self.survey_started = True
-        self._show_current_screen()
+        self._go_survey()
     
     def _on_start_over(self, widget: Optional[toga.Widget]) -> None:
         """Start survey over from home screen"""
         if self.controller:
             self.controller.restart()
-        self.on_home_screen = False
         self.survey_started = True
-        self.showing_truth_web = False
-        self._show_current_screen()
+        self._go_question()
 
     def _build_question_screen(self) -> toga.Box:
         if self.controller is None:
             return self._build_home_screen()
-        
+
         idx = self.controller.current_index
         total = len(self.controller.question_set)
-        question_data = self.controller.question_set[idx]
-        question_text = question_data["text"]
-
-        root = toga.Box(style=Pack(direction=COLUMN, alignment=CENTER, padding=16))
-        progress = toga.Label(f"Question {idx + 1} of {total}", style=Pack(padding=(0, 0, 12, 0)))
-        question = toga.Label(question_text, style=Pack(padding=8))
-
-        buttons = toga.Box(style=Pack(direction=ROW, padding_top=12))
-        agree_btn = toga.Button("Agree", style=Pack(padding=8), on_press=lambda w: self._on_answer(True))
-        disagree_btn = toga.Button("Disagree", style=Pack(padding=8), on_press=lambda w: self._on_answer(False))
-        buttons.add(agree_btn)
-        buttons.add(disagree_btn)
-
-        root.add(progress)
-        root.add(question)
-        root.add(buttons)
-        return root
+        question_text = self.controller.texts[idx]
+
+        if self._question_screen is None:
+            # Build the widget tree once; answering a question only updates
+            # the two labels below
+            root = toga.Box(style=Pack(direction=COLUMN, alignment=CENTER, padding=16))
+            self._question_progress_label = toga.Label("", style=Pack(padding=(0, 0, 12, 0)))
+            self._question_text_label = toga.Label("", style=Pack(padding=8))
+
+            buttons = toga.Box(style=Pack(direction=ROW, padding_top=12))
+            agree_btn = toga.Button("Agree", style=Pack(padding=8), on_press=partial(self._on_answer_pressed, True))
+            disagree_btn = toga.Button("Disagree", style=Pack(padding=8), on_press=partial(self._on_answer_pressed, False))
+            buttons.add(agree_btn)
+            buttons.add(disagree_btn)
+
+            root.add(self._question_progress_label)
+            root.add(self._question_text_label)
+            root.add(buttons)
+            self._question_screen = root
+
+        self._question_progress_label.text = f"Question {idx + 1} of {total}"
+        self._question_text_label.text = question_text
+        return self._question_screen
 
     def _on_answer(self, value: bool) -> None:
         if self.controller is None:
@@ -271,12 +792,12 @@ class SurveyApp(toga.App):
         # If we're in contradiction resolution mode, handle differently
         if self.resolving_contradictions and self.selected_question_to_change is not None:
             # Update the answer for the selected question
-            key = self.controller._key_for(self.selected_question_to_change)
-            question_data = self.controller.question_set[self.selected_question_to_change]
-            question_text = question_data["text"]
+            key = self.controller.keys[self.selected_question_to_change]
+            question_text = self.controller.texts[self.selected_question_to_change]
             self.controller.answers[key] = [question_text, value]
-            save_answers(self.controller.responses_path, self.controller.answers)
-            
+            self.controller.schedule_save()
+            self.controller.invalidate_detection_caches()
+
             # Reset selected question
             self.selected_question_to_change = None
             
@@ -295,140 +816,174 @@ class SurveyApp(toga.App):
                 # If it was resolved, we'll automatically move to the next one
                 # Reset to 0 to show the first remaining contradiction
                 self.contradiction_resolution_index = 0
+            if self.resolving_contradictions:
+                self._go_resolution()
+            else:
+                self._go_truth_web()
         else:
             # Normal answer recording
             self.controller.record_answer(value)
-        
-        self._show_current_screen()
+            self._go_survey()
 
     def _build_results_screen(self) -> toga.Box:
-        root = toga.Box(style=Pack(direction=COLUMN, padding=16))
-        title = toga.Label("Results", style=Pack(padding=(0, 0, 12, 0)))
-
-        # Answers table
-        answers_label = toga.Label("Your Answers:", style=Pack(padding=(0, 0, 8, 0)))
-        table = toga.Table(
-            headings=["Question", "Answer"],
-            accessors=["question", "answer"],
-            multiple_select=False,
-            style=Pack(flex=1)
-        )
+        if self._results_screen is None:
+            # Static skeleton built once; the table rows and contradictions
+            # section are refreshed per render below
+            root = toga.Box(style=Pack(direction=COLUMN, padding=16))
+            title = toga.Label("Results", style=Pack(padding=(0, 0, 12, 0)))
 
-        for i in range(len(self.controller.question_set)):
-            key = self.controller._key_for(i)
-            entry = self.controller.answers.get(key)
-            if entry:
-                question_text, value = entry
-                table.data.append({
-                    "question": question_text,
-                    "answer": "Agree" if bool(value) else "Disagree",
-                })
+            # Answers table
+            answers_label = toga.Label("Your Answers:", style=Pack(padding=(0, 0, 8, 0)))
+            self._results_table = toga.Table(
+                headings=["Question", "Answer"],
+                accessors=["question", "answer"],
+                multiple_select=False,
+                style=Pack(flex=1)
+            )
 
-        root.add(title)
-        root.add(answers_label)
-        root.add(table)
+            root.add(title)
+            root.add(answers_label)
+            root.add(self._results_table)
 
-        # Contradictions section
-        contradictions = self.controller.detect_contradictions()
-        if contradictions:
-            contradictions_label = toga.Label(
+            # Contradictions section widgets; the dynamic box holds whichever
+            # of them applies on a given render
+            self._results_dynamic_box = toga.Box(style=Pack(direction=COLUMN))
+            self._results_contradictions_label = toga.Label(
                 "⚠️ Contradictory Answers Detected:",
                 style=Pack(padding=(16, 0, 8, 0))
             )
-            root.add(contradictions_label)
-            
-            contradictions_text = "\n\n".join(
-                f"• Question {i+1}: \"{q1}\"\n  contradicts\n  Question {j+1}: \"{q2}\"\n  (You agreed with both)"
-                for i, j, q1, q2 in contradictions
-            )
-            
-            contradictions_view = toga.MultilineTextInput(
-                value=contradictions_text,
+            self._results_contradictions_view = toga.MultilineTextInput(
                 readonly=True,
                 style=Pack(padding=8, flex=1)
             )
-            root.add(contradictions_view)
-        else:
-            no_contradictions = toga.Label(
+            self._results_ok_label = toga.Label(
                 "✓ No contradictions detected",
                 style=Pack(padding=(16, 0, 8, 0))
             )
-            root.add(no_contradictions)
+            root.add(self._results_dynamic_box)
 
-        button_box = toga.Box(style=Pack(direction=ROW, padding_top=12, alignment=CENTER))
-        
-        truth_web_btn = toga.Button(
-            "TruthWeb",
-            style=Pack(padding=8, flex=1),
-            on_press=self._on_show_truth_web
-        )
-        
-        home_btn = toga.Button(
-            "Home",
-            style=Pack(padding=8, flex=1),
-            on_press=self._on_go_home
-        )
-        
-        restart_btn = toga.Button(
-            "Restart",
-            style=Pack(padding=8, flex=1),
-            on_press=self._on_restart
-        )
-        
-        button_box.add(truth_web_btn)
-        button_box.add(home_btn)
-        button_box.add(restart_btn)
-        root.add(button_box)
-        
-        return root
+            button_box = toga.Box(style=Pack(direction=ROW, padding_top=12, alignment=CENTER))
+
+            truth_web_btn = toga.Button(
+                "TruthWeb",
+                style=Pack(padding=8, flex=1),
+                on_press=self._on_show_truth_web
+            )
+
+            home_btn = toga.Button(
+                "Home",
+                style=Pack(padding=8, flex=1),
+                on_press=self._on_go_home
+            )
+
+            restart_btn = toga.Button(
+                "Restart",
+                style=Pack(padding=8, flex=1),
+                on_press=self._on_restart
+            )
+
+            button_box.add(truth_web_btn)
+            button_box.add(home_btn)
+            button_box.add(restart_btn)
+            root.add(button_box)
+
+            self._results_screen = root
+
+        # Repopulate the answers table; keys and answers hoisted out of
+        # the loop so each row costs one .get()
+        self._results_table.data = []
+        answers = self.controller.answers
+        for key in self.controller.keys:
+            entry = answers.get(key)
+            if entry:
+                question_text, value = entry
+                self._results_table.data.append({
+                    "question": question_text,
+                    "answer": "Agree" if bool(value) else "Disagree",
+                })
+
+        # Refresh the contradictions section
+        dynamic_box = self._results_dynamic_box
+        for child in list(dynamic_box.children):
+            dynamic_box.remove(child)
+
+        contradictions = self.controller.detect_contradictions()
+        if contradictions:
+            # Assemble flat fragments and join once, avoiding an
+            # intermediate f-string per pair
+            parts: list[str] = []
+            append = parts.append
+            for i, j, q1, q2 in contradictions:
+                append("• Question ")
+                append(str(i + 1))
+                append(': "')
+                append(q1)
+                append('"\n  contradicts\n  Question ')
+                append(str(j + 1))
+                append(': "')
+                append(q2)
+                append('"\n  (You agreed with both)\n\n')
+            self._results_contradictions_view.value = "".join(parts).rstrip("\n")
+            dynamic_box.add(self._results_contradictions_label)
+            dynamic_box.add(self._results_contradictions_view)
+        else:
+            dynamic_box.add(self._results_ok_label)
+
+        return self._results_screen
+
+    def on_exit(self) -> bool:
+        """Flush any pending answer writes before the app closes."""
+        if self.controller:
+            self.controller.flush()
+        return True
 
     def _on_restart(self, widget: Optional[toga.Widget]) -> None:
         """Restart survey and return to home screen"""
         if self.controller:
             self.controller.restart()
         self.showing_truth_web = False  # Reset view state
-        self.on_home_screen = True  # Return to home screen
         self.survey_started = False
         self.selected_question_set = None
         self.controller = None
-        self._show_current_screen()
+        self._go_home()
     
     def _on_go_home(self, widget: Optional[toga.Widget]) -> None:
         """Return to home screen"""
+        if self.controller:
+            self.controller.flush()
         self.showing_truth_web = False
         self.resolving_contradictions = False
         self.selected_question_to_change = None
         self.contradiction_resolution_index = 0
-        self.on_home_screen = True
         # Don't reset controller - keep it so we can show status on home screen
-        self._show_current_screen()
+        self._go_home()
 
     def _on_show_truth_web(self, widget: Optional[toga.Widget]) -> None:
         """Switch to TruthWeb view"""
-        self.showing_truth_web = True
-        self._show_current_screen()
+        if self.controller:
+            self.controller.flush()
+        self._go_truth_web()
 
     def _on_back_to_results(self, widget: Optional[toga.Widget]) -> None:
         """Switch back to results view"""
-        self.showing_truth_web = False
         self.resolving_contradictions = False
         self.selected_question_to_change = None
-        self._show_current_screen()
+        self._go_results()
     
     def _on_start_resolve_contradictions(self, widget: Optional[toga.Widget]) -> None:
         """Start contradiction resolution flow"""
         try:
-            print("DEBUG: _on_start_resolve_contradictions called")
+            logger.debug("_on_start_resolve_contradictions called")
             if self.controller is None:
-                print("DEBUG: Controller is None")
+                logger.debug("Controller is None")
                 self.main_window.info_dialog("Error", "Controller is not available")
                 return
-            
+
             contradictions = self.controller.detect_contradictions()
-            print(f"DEBUG: Found {len(contradictions)} contradictions")
-            
+            logger.debug("Found %d contradictions", len(contradictions))
+
             if not contradictions:
-                print("DEBUG: No contradictions found")
+                logger.debug("No contradictions found")
                 self.main_window.info_dialog("No Contradictions", "There are no contradictions to resolve.")
                 return
             
@@ -440,17 +995,30 @@ class SurveyApp(toga.App):
             self.showing_truth_web = False  # Exit truth web mode
             self.on_home_screen = False  # Make sure we're not on home screen
             
-            print(f"DEBUG: Starting resolution, contradictions_to_resolve: {len(self.contradictions_to_resolve)}")
-            print(f"DEBUG: State - resolving: {self.resolving_contradictions}, showing_truth_web: {self.showing_truth_web}, on_home: {self.on_home_screen}")
-            
+            logger.debug(
+                "Starting resolution, contradictions_to_resolve: %d",
+                len(self.contradictions_to_resolve),
+            )
+            logger.debug(
+                "State - resolving: %s, showing_truth_web: %s, on_home: %s",
+                self.resolving_contradictions,
+                self.showing_truth_web,
+                self.on_home_screen,
+            )
+
             # Force screen refresh
-            self._show_current_screen()
+            self._go_resolution()
         except Exception as e:
-            print(f"DEBUG: Error in _on_start_resolve_contradictions: {e}")
-            import traceback
-            traceback.print_exc()
+            logger.exception("Error in _on_start_resolve_contradictions")
             self.main_window.info_dialog("Error", f"Error starting contradiction resolution: {str(e)}")
 
+    def _graph_state_key(self) -> tuple:
+        """Cache key covering everything the TruthWeb graph depends on."""
+        return (
+            self.controller.question_set_name,
+            tuple(sorted((k, bool(v[1])) for k, v in self.controller.answers.items())),
+        )
+
     def _build_truth_web_screen(self) -> toga.Box:
         """Build the TruthWeb visualization screen with graph image"""
         if self.controller is None:
@@ -501,69 +1069,92 @@ class SurveyApp(toga.App):
         )
         content_box.add(legend)
         
-        # Generate and display graph
-        if PILLOW_AVAILABLE:
-            try:
-                # Generate image and get node positions for click handling
-                result = self._generate_graph_image()
-                if result:
-                    graph_image_path, node_positions = result
-                    if graph_image_path and graph_image_path.exists():
-                        # Always use WebView for interactive graph (clickable nodes)
-                        # Fallback to image with buttons if WebView fails
-                        use_webview = False
-                        try:
-                            # Create interactive HTML with Canvas
-                            interactive_html = self._create_interactive_graph_html(node_positions)
-                            
-                            # Save HTML to file first (file:// URLs are more reliable than data:// on Android)
-                            html_file_path = self.paths.data / 'truthweb_interactive.html'
-                            html_file_path.parent.mkdir(parents=True, exist_ok=True)
-                            html_file_path.write_text(interactive_html, encoding='utf-8')
-                            
-                            # Try WebView with file:// URL
-                            file_url = html_file_path.as_uri()
-                            
-                            webview = toga.WebView(
-                                style=Pack(flex=1, width=600, height=600),
-                                url=file_url
-                            )
-                            content_box.add(webview)
-                            use_webview = True
-                        except Exception as e:
-                            # WebView failed, use image fallback
-                            import traceback
-                            print(f"WebView failed: {e}")
-                            traceback.print_exc()
-                            use_webview = False
-                        
-                        if not use_webview:
-                            # Fallback: Use Pillow image with clickable buttons below
-                            self._add_image_with_clickable_buttons(content_box, graph_image_path, node_positions)
+        # Generate and display graph. The WebView canvas draws its own
+        # vectors from the shared memoised layout, so the PNG is rasterized
+        # solely when the WebView fallback kicks in.
+        use_webview = False
+        try:
+            cache_key = self._graph_state_key()
+            edges_key = (
+                self.controller.question_set_name,
+                tuple((i, j) for i, j, _, _ in self.controller.detect_contradictions()),
+                tuple((i, j) for i, j, _, _ in self.controller.detect_requirements()),
+            )
+            webview = self._truth_web_webview
+            if webview is not None and edges_key == self._graph_edges_key:
+                # The loaded page already shows the right questions and
+                # edges; if node flags changed, patch them over the live
+                # canvas instead of rewriting the file and reloading
+                if cache_key != self._webview_state_key:
+                    answered_flags, agreed_flags = self.controller.answer_flags()
+                    webview.evaluate_javascript(
+                        f"nodes.a={json.dumps(answered_flags)};"
+                        f"nodes.g={json.dumps(agreed_flags)};drawGraph()"
+                    )
+                    self._webview_state_key = cache_key
+            else:
+                # Save HTML to file (file:// URLs are more reliable than data:// on Android);
+                # skip the rebuild and rewrite when nothing changed since the last render
+                html_file_path = self._truth_web_html_path
+                html_up_to_date = (
+                    cache_key == self._html_cache_key
+                    and html_file_path.exists()
+                    and html_file_path.stat().st_mtime == self._html_cache_mtime
+                )
+                if not html_up_to_date:
+                    # Create interactive HTML with Canvas
+                    interactive_html = self._create_interactive_graph_html()
+                    html_file_path.parent.mkdir(parents=True, exist_ok=True)
+                    html_file_path.write_text(interactive_html, encoding='utf-8')
+                    self._html_cache_key = cache_key
+                    self._html_cache_mtime = html_file_path.stat().st_mtime
+
+                # (Re)load the WebView with the file:// URL
+                file_url = html_file_path.as_uri()
+                if webview is None:
+                    webview = toga.WebView(
+                        style=Pack(flex=1, width=600, height=600),
+                        url=file_url
+                    )
+                    self._truth_web_webview = webview
+                else:
+                    webview.url = file_url
+                self._graph_edges_key = edges_key
+                self._webview_state_key = cache_key
+
+            content_box.add(webview)
+            use_webview = True
+        except Exception:
+            # WebView failed, use image fallback
+            logger.exception("WebView failed")
+
+        if not use_webview:
+            # Fallback: Use Pillow image with clickable buttons below
+            if _load_pillow():
+                try:
+                    # Cached inside _generate_graph_image while answers are unchanged
+                    result = self._generate_graph_image()
+                    if result and result[0].exists():
+                        graph_image_path, node_positions = result
+                        self._add_image_with_clickable_buttons(content_box, graph_image_path, node_positions)
                     else:
                         error_label = toga.Label(
                             "Could not generate graph image",
                             style=Pack(padding=16)
                         )
                         content_box.add(error_label)
-                else:
+                except Exception as e:
                     error_label = toga.Label(
-                        "Could not generate graph image",
+                        f"Error generating graph: {str(e)}",
                         style=Pack(padding=16)
                     )
                     content_box.add(error_label)
-            except Exception as e:
+            else:
                 error_label = toga.Label(
-                    f"Error generating graph: {str(e)}",
+                    "Pillow is not available. Please install Pillow.",
                     style=Pack(padding=16)
                 )
                 content_box.add(error_label)
-        else:
-            error_label = toga.Label(
-                "Pillow is not available. Please install Pillow.",
-                style=Pack(padding=16)
-            )
-            content_box.add(error_label)
         
         scroll.content = content_box
         root.add(scroll)
@@ -600,29 +1191,21 @@ class SurveyApp(toga.App):
         )
         container.add(buttons_label)
         
-        # Create buttons row - wrap them if needed
-        buttons_row = toga.Box(style=Pack(direction=ROW, padding=4, alignment=CENTER, flex_wrap="wrap"))
-        
-        for i in range(len(self.controller.question_set)):
-            def make_handler(q_idx: int):
-                return lambda widget: self._on_question_click(q_idx)
-            
-            # Color button based on answer status
-            key = self.controller._key_for(i)
-            answered = key in self.controller.answers
-            if answered:
-                agreed = self.controller.answers[key][1]
-                button_text = f"🔵 Q{i+1}" if agreed else f"⚪ Q{i+1}"
-            else:
-                button_text = f"⚪ Q{i+1}"
-            
-            node_btn = toga.Button(
-                button_text,
-                style=Pack(padding=8, width=70, height=45),
-                on_press=make_handler(i)
-            )
-            buttons_row.add(node_btn)
-        
+        # Create buttons row - wrap them if needed; the buttons go in as a
+        # batch so the row lays out once
+        short_labels = self.controller.button_labels()
+        node_btn_style = Pack(padding=8, width=70, height=45)
+        buttons_row = toga.Box(
+            style=Pack(direction=ROW, padding=4, alignment=CENTER, flex_wrap="wrap"),
+            children=[
+                toga.Button(
+                    button_text,
+                    style=node_btn_style,
+                    on_press=partial(self._on_question_btn_pressed, i)
+                )
+                for i, button_text in enumerate(short_labels)
+            ]
+        )
         container.add(buttons_row)
         
         # Also add the full question list for easier access
@@ -632,49 +1215,52 @@ class SurveyApp(toga.App):
         )
         container.add(questions_label)
         
-        # Create clickable buttons for each question with full text
-        for i in range(len(self.controller.question_set)):
-            key = self.controller._key_for(i)
-            answered = key in self.controller.answers
-            agreed = False
-            status = "⚪"
-            if answered:
-                agreed = self.controller.answers[key][1]
-                status = "🔵" if agreed else "⚪"
-            
-            question_text = self.controller.question_set[i]['text']
-            # Truncate for button label
-            short_text = question_text[:50] + "..." if len(question_text) > 50 else question_text
-            
-            def make_click_handler(q_idx: int):
-                return lambda widget: self._on_question_click(q_idx)
-            
-            question_btn = toga.Button(
-                f"{status} Q{i+1}: {short_text}",
-                style=Pack(padding=6),
-                on_press=make_click_handler(i)
-            )
-            container.add(question_btn)
+        # A DetailedList is virtualized by the mobile backends, so only
+        # the visible rows are materialized no matter how long the
+        # question set gets (one Button per question is not)
+        question_list = toga.DetailedList(
+            data=[
+                {"title": short_label, "subtitle": self.controller._short_texts[i]}
+                for i, short_label in enumerate(short_labels)
+            ],
+            on_select=self._on_question_row_selected,
+            style=Pack(flex=1, height=400)
+        )
+        container.add(question_list)
     
+    def _on_question_row_selected(self, widget: toga.DetailedList) -> None:
+        """List adapter: map the selected row back to its question index"""
+        row = widget.selection
+        if row is not None:
+            self._on_question_click(widget.data.index(row))
+
     def _build_contradiction_resolution_screen(self) -> toga.Box:
         """Build screen showing two contradictory questions to resolve"""
-        print(f"DEBUG: Building contradiction resolution screen, controller: {self.controller is not None}, contradictions: {len(self.contradictions_to_resolve) if self.contradictions_to_resolve else 0}")
+        logger.debug(
+            "Building contradiction resolution screen, controller: %s, contradictions: %d",
+            self.controller is not None,
+            len(self.contradictions_to_resolve) if self.contradictions_to_resolve else 0,
+        )
         if self.controller is None:
-            print("DEBUG: No controller, returning home")
+            logger.debug("No controller, returning home")
             return self._build_home_screen()
         if not self.contradictions_to_resolve:
-            print("DEBUG: No contradictions to resolve, returning home")
+            logger.debug("No contradictions to resolve, returning home")
             return self._build_home_screen()
-        
+
         if self.contradiction_resolution_index >= len(self.contradictions_to_resolve):
             # All contradictions resolved
-            print("DEBUG: All contradictions resolved, returning to TruthWeb")
+            logger.debug("All contradictions resolved, returning to TruthWeb")
             self.resolving_contradictions = False
             self.showing_truth_web = True
             return self._build_truth_web_screen()
-        
-        print(f"DEBUG: Showing contradiction {self.contradiction_resolution_index + 1} of {len(self.contradictions_to_resolve)}")
-        
+
+        logger.debug(
+            "Showing contradiction %d of %d",
+            self.contradiction_resolution_index + 1,
+            len(self.contradictions_to_resolve),
+        )
+
         root = toga.Box(style=Pack(direction=COLUMN, padding=0))
         
         # Header with progress and back button (fixed at top)
@@ -700,10 +1286,13 @@ class SurveyApp(toga.App):
         q1_idx, q2_idx, q1_text, q2_text = self.contradictions_to_resolve[self.contradiction_resolution_index]
         
         # Get current answers
-        key1 = self.controller._key_for(q1_idx)
-        key2 = self.controller._key_for(q2_idx)
-        answer1 = self.controller.answers.get(key1, [None, None])[1] if key1 in self.controller.answers else None
-        answer2 = self.controller.answers.get(key2, [None, None])[1] if key2 in self.controller.answers else None
+        key1 = self.controller.keys[q1_idx]
+        key2 = self.controller.keys[q2_idx]
+        # Single .get() per key: no second hash for the membership test
+        entry1 = self.controller.answers.get(key1)
+        entry2 = self.controller.answers.get(key2)
+        answer1 = entry1[1] if entry1 is not None else None
+        answer2 = entry2[1] if entry2 is not None else None
         
         answer1_text = "Agree" if answer1 else "Disagree"
         answer2_text = "Agree" if answer2 else "Disagree"
@@ -719,7 +1308,7 @@ class SurveyApp(toga.App):
         # Question 1 box
         q1_box = toga.Box(style=Pack(direction=COLUMN, padding=12, margin_bottom=8))
         q1_header = toga.Label(
-            f"Question {q1_idx + 1}:",
+            f"{question_label(q1_idx)}:",
             style=Pack(padding=(0, 0, 8, 0), font_weight="bold")
         )
         q1_text_label = toga.Label(
@@ -731,9 +1320,9 @@ class SurveyApp(toga.App):
             style=Pack(padding=(0, 0, 8, 0), font_weight="bold")
         )
         change_q1_btn = toga.Button(
-            f"Change Answer to Question {q1_idx + 1}",
+            f"Change Answer to {question_label(q1_idx)}",
             style=Pack(padding=12),
-            on_press=lambda w: self._on_select_question_to_change(q1_idx)
+            on_press=partial(self._on_change_question_pressed, q1_idx)
         )
         q1_box.add(q1_header)
         q1_box.add(q1_text_label)
@@ -751,7 +1340,7 @@ class SurveyApp(toga.App):
         # Question 2 box
         q2_box = toga.Box(style=Pack(direction=COLUMN, padding=12, margin_bottom=8))
         q2_header = toga.Label(
-            f"Question {q2_idx + 1}:",
+            f"{question_label(q2_idx)}:",
             style=Pack(padding=(0, 0, 8, 0), font_weight="bold")
         )
         q2_text_label = toga.Label(
@@ -763,9 +1352,9 @@ class SurveyApp(toga.App):
             style=Pack(padding=(0, 0, 8, 0), font_weight="bold")
         )
         change_q2_btn = toga.Button(
-            f"Change Answer to Question {q2_idx + 1}",
+            f"Change Answer to {question_label(q2_idx)}",
             style=Pack(padding=12),
-            on_press=lambda w: self._on_select_question_to_change(q2_idx)
+            on_press=partial(self._on_change_question_pressed, q2_idx)
         )
         q2_box.add(q2_header)
         q2_box.add(q2_text_label)
@@ -783,300 +1372,127 @@ class SurveyApp(toga.App):
         if self.controller is None or self.selected_question_to_change is None:
             return self._build_contradiction_resolution_screen()
         
-        root = toga.Box(style=Pack(direction=COLUMN, alignment=CENTER, padding=16))
-        
         q_idx = self.selected_question_to_change
-        question_data = self.controller.question_set[q_idx]
-        question_text = question_data["text"]
-        
+        question_text = self.controller.texts[q_idx]
+
         # Get current answer
-        key = self.controller._key_for(q_idx)
-        current_answer = None
-        if key in self.controller.answers:
-            current_answer = self.controller.answers[key][1]
-        
-        # Header
-        header_label = toga.Label(
-            f"Change Answer for Question {q_idx + 1}",
-            style=Pack(padding=(0, 0, 16, 0), font_weight="bold", font_size=18)
-        )
-        root.add(header_label)
-        
-        # Question text
-        question_label = toga.Label(
-            question_text,
-            style=Pack(padding=(0, 0, 24, 0))
-        )
-        root.add(question_label)
-        
-        # Current answer
+        key = self.controller.keys[q_idx]
+        entry = self.controller.answers.get(key)
+        current_answer = entry[1] if entry is not None else None
+
+        if self._change_answer_screen is None:
+            # Build the widget tree once; later shows only retext the three
+            # labels that depend on the selected question
+            root = toga.Box(style=Pack(direction=COLUMN, alignment=CENTER, padding=16))
+
+            self._change_answer_header_label = toga.Label(
+                "",
+                style=Pack(padding=(0, 0, 16, 0), font_weight="bold", font_size=18)
+            )
+            root.add(self._change_answer_header_label)
+
+            self._change_answer_question_label = toga.Label(
+                "",
+                style=Pack(padding=(0, 0, 24, 0))
+            )
+            root.add(self._change_answer_question_label)
+
+            self._change_answer_current_label = toga.Label(
+                "",
+                style=Pack(padding=(0, 0, 16, 0), font_weight="bold")
+            )
+            root.add(self._change_answer_current_label)
+
+            # New answer options
+            instruction = toga.Label(
+                "Select your new answer:",
+                style=Pack(padding=(0, 0, 12, 0))
+            )
+            root.add(instruction)
+
+            buttons = toga.Box(style=Pack(direction=ROW, padding_top=12))
+            agree_btn = toga.Button(
+                "Agree",
+                style=Pack(padding=12, width=150),
+                on_press=partial(self._on_answer_pressed, True)
+            )
+            disagree_btn = toga.Button(
+                "Disagree",
+                style=Pack(padding=12, width=150),
+                on_press=partial(self._on_answer_pressed, False)
+            )
+            buttons.add(agree_btn)
+            buttons.add(disagree_btn)
+            root.add(buttons)
+
+            # Cancel button
+            cancel_btn = toga.Button(
+                "Cancel",
+                style=Pack(padding=12, margin_top=16, width=150),
+                on_press=self._on_cancel_change_answer
+            )
+            root.add(cancel_btn)
+
+            self._change_answer_screen = root
+
         current_answer_text = "Agree" if current_answer else "Disagree"
-        current_label = toga.Label(
-            f"Current Answer: {current_answer_text}",
-            style=Pack(padding=(0, 0, 16, 0), font_weight="bold")
-        )
-        root.add(current_label)
-        
-        # New answer options
-        instruction = toga.Label(
-            "Select your new answer:",
-            style=Pack(padding=(0, 0, 12, 0))
-        )
-        root.add(instruction)
-        
-        buttons = toga.Box(style=Pack(direction=ROW, padding_top=12))
-        agree_btn = toga.Button(
-            "Agree",
-            style=Pack(padding=12, width=150),
-            on_press=lambda w: self._on_answer(True)
-        )
-        disagree_btn = toga.Button(
-            "Disagree",
-            style=Pack(padding=12, width=150),
-            on_press=lambda w: self._on_answer(False)
-        )
-        buttons.add(agree_btn)
-        buttons.add(disagree_btn)
-        root.add(buttons)
-        
-        # Cancel button
-        cancel_btn = toga.Button(
-            "Cancel",
-            style=Pack(padding=12, margin_top=16, width=150),
-            on_press=self._on_cancel_change_answer
-        )
-        root.add(cancel_btn)
-        
-        return root
+        self._change_answer_header_label.text = f"Change Answer for {question_label(q_idx)}"
+        self._change_answer_question_label.text = question_text
+        self._change_answer_current_label.text = f"Current Answer: {current_answer_text}"
+        return self._change_answer_screen
     
     def _on_select_question_to_change(self, question_index: int) -> None:
         """Handle selection of which question to change in contradiction resolution"""
         self.selected_question_to_change = question_index
-        self._show_current_screen()
+        self._go_resolution()
     
     def _on_cancel_change_answer(self, widget: Optional[toga.Widget]) -> None:
         """Cancel changing answer and go back to contradiction selection"""
         self.selected_question_to_change = None
-        self._show_current_screen()
+        self._go_resolution()
     
     def _on_cancel_resolve_contradictions(self, widget: Optional[toga.Widget]) -> None:
         """Cancel contradiction resolution and return to TruthWeb"""
         self.resolving_contradictions = False
         self.selected_question_to_change = None
         self.contradiction_resolution_index = 0
-        self.showing_truth_web = True
-        self._show_current_screen()
+        self._go_truth_web()
     
-    def _create_interactive_graph_html(self, node_positions: List[Tuple[float, float]]) -> str:
+    def _create_interactive_graph_html(self) -> str:
         """Create HTML with clickable graph using Canvas"""
         if self.controller is None:
             return ""
-        
-        import json
-        
-        # Prepare data - scale node positions from 800x800 image to 600x600 canvas
-        scale_factor = 600.0 / 800.0  # Scale from 800px image to 600px canvas
-        nodes = []
-        for i in range(len(self.controller.question_set)):
-            key = self.controller._key_for(i)
-            answered = key in self.controller.answers
-            agreed = False
-            if answered:
-                agreed = self.controller.answers[key][1]
-            # Scale positions to match 600x600 canvas
-            orig_x, orig_y = node_positions[i]
-            scaled_x = orig_x * scale_factor
-            scaled_y = orig_y * scale_factor
-            nodes.append({
-                'index': i,
-                'answered': answered,
-                'agreed': agreed,
-                'x': scaled_x,
-                'y': scaled_y
-            })
+
+        # Node positions come pre-scaled to the 600x600 canvas from the
+        # shared memoised layout; both flag lists come from one pass over
+        # the answers dict. The payload is struct-of-arrays with one-letter
+        # flag keys to keep the embedded JSON small.
+        scaled_positions = _canvas_positions(len(self.controller.question_set))
+        answered_flags, agreed_flags = self.controller.answer_flags()
+        nodes = {
+            'x': [x for x, _ in scaled_positions],
+            'y': [y for _, y in scaled_positions],
+            'a': answered_flags,
+            'g': agreed_flags,
+        }
         
         contradictions = [[i, j] for i, j, _, _ in self.controller.detect_contradictions()]
         requirements = [[i, j] for i, j, _, _ in self.controller.detect_requirements()]
         
-        # Create JavaScript data
-        questions_data = [q['text'] for q in self.controller.question_set]
-        questions_js = json.dumps(questions_data, ensure_ascii=False)
-        nodes_js = json.dumps(nodes, ensure_ascii=False)
+        # Create JavaScript data; question texts are pre-serialised on the controller
+        questions_js = self.controller._questions_js
+        nodes_js = json.dumps(nodes)
         contradictions_js = json.dumps(contradictions, ensure_ascii=False)
         requirements_js = json.dumps(requirements, ensure_ascii=False)
         
-        html = f"""<!DOCTYPE html>
-<html>
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>TruthWeb</title>
-    <style>
-        * {{ margin: 0; padding: 0; box-sizing: border-box; }}
-        body {{ margin: 0; padding: 8px; background: white; font-family: Arial, sans-serif; }}
-        #canvasContainer {{ text-align: center; margin: 8px 0; }}
-        canvas {{ border: 1px solid #ddd; max-width: 100%; height: auto; display: block; margin: 0 auto; }}
-        #info {{ padding: 12px; background: #f0f0f0; margin-top: 8px; border-radius: 4px; font-size: 14px; min-height: 60px; line-height: 1.5; }}
-        #info strong {{ color: #333; display: block; margin-bottom: 4px; }}
-    </style>
-</head>
-<body>
-    <div id="canvasContainer">
-        <canvas id="graphCanvas" width="600" height="600"></canvas>
-    </div>
-    <div id="info">Tap a node (Q1-Q10) on the graph above to see question details</div>
-    <script>
-        const canvas = document.getElementById('graphCanvas');
-        const ctx = canvas.getContext('2d');
-        const info = document.getElementById('info');
-        
-        const questions = {questions_js};
-        const nodes = {nodes_js};
-        const contradictions = {contradictions_js};
-        const requirements = {requirements_js};
-        
-        const width = 600;
-        const height = 600;
-        const nodeRadius = 30;
-        
-        function drawGraph() {{
-            // Clear canvas
-            ctx.fillStyle = 'white';
-            ctx.fillRect(0, 0, width, height);
-            
-            // Draw connections first (so they appear behind nodes)
-            // Draw contradictions in red
-            contradictions.forEach(([i, j]) => {{
-                if (i < nodes.length && j < nodes.length) {{
-                    const n1 = nodes[i];
-                    const n2 = nodes[j];
-                    ctx.strokeStyle = '#d32f2f';
-                    ctx.lineWidth = 4;
-                    ctx.beginPath();
-                    ctx.moveTo(n1.x, n1.y);
-                    ctx.lineTo(n2.x, n2.y);
-                    ctx.stroke();
-                }}
-            }});
-            
-            // Draw requirements in green
-            requirements.forEach(([i, j]) => {{
-                if (i < nodes.length && j < nodes.length) {{
-                    const n1 = nodes[i];
-                    const n2 = nodes[j];
-                    ctx.strokeStyle = '#388e3c';
-                    ctx.lineWidth = 4;
-                    ctx.beginPath();
-                    ctx.moveTo(n1.x, n1.y);
-                    ctx.lineTo(n2.x, n2.y);
-                    ctx.stroke();
-                }}
-            }});
-            
-            // Draw nodes
-            nodes.forEach(node => {{
-                let fillColor = '#e0e0e0';  // Light gray for unanswered
-                let strokeColor = '#999999';
-                if (node.answered) {{
-                    if (node.agreed) {{
-                        fillColor = '#4a90e2';  // Blue for agreed
-                        strokeColor = '#2d5aa0';
-                    }} else {{
-                        fillColor = '#cccccc';  // Gray for disagreed
-                        strokeColor = '#888888';
-                    }}
-                }}
-                
-                // Draw circle
-                ctx.fillStyle = fillColor;
-                ctx.strokeStyle = strokeColor;
-                ctx.lineWidth = 3;
-                ctx.beginPath();
-                ctx.arc(node.x, node.y, nodeRadius, 0, 2 * Math.PI);
-                ctx.fill();
-                ctx.stroke();
-                
-                // Draw question number
-                ctx.fillStyle = 'white';
-                ctx.font = 'bold 16px Arial';
-                ctx.textAlign = 'center';
-                ctx.textBaseline = 'middle';
-                ctx.fillText('Q' + (node.index + 1), node.x, node.y);
-            }});
-        }}
-        
-        // Handle clicks and touches
-        function getCanvasCoordinates(e) {{
-            const rect = canvas.getBoundingClientRect();
-            const scaleX = canvas.width / rect.width;
-            const scaleY = canvas.height / rect.height;
-            
-            let clientX, clientY;
-            if (e.touches && e.touches.length > 0) {{
-                // Touch event
-                clientX = e.touches[0].clientX;
-                clientY = e.touches[0].clientY;
-            }} else if (e.changedTouches && e.changedTouches.length > 0) {{
-                // Touch end event
-                clientX = e.changedTouches[0].clientX;
-                clientY = e.changedTouches[0].clientY;
-            }} else {{
-                // Mouse/click event
-                clientX = e.clientX;
-                clientY = e.clientY;
-            }}
-            
-            const x = (clientX - rect.left) * scaleX;
-            const y = (clientY - rect.top) * scaleY;
-            return {{x: x, y: y}};
-        }}
-        
-        function handleInteraction(e) {{
-            e.preventDefault();
-            e.stopPropagation();
-            
-            const coords = getCanvasCoordinates(e);
-            const x = coords.x;
-            const y = coords.y;
-            
-            // Find which node was clicked
-            for (let i = 0; i < nodes.length; i++) {{
-                const node = nodes[i];
-                const dx = x - node.x;
-                const dy = y - node.y;
-                const distance = Math.sqrt(dx * dx + dy * dy);
-                
-                if (distance <= nodeRadius + 5) {{
-                    const answered = node.answered;
-                    const agreed = node.agreed;
-                    const answerText = answered ? (agreed ? 'Agree' : 'Disagree') : 'Not answered';
-                    const questionText = questions[node.index];
-                    const qNum = node.index + 1;
-                    
-                    // Update info display
-                    info.innerHTML = '<strong>Question ' + qNum + ':</strong>' + 
-                                   '<br>' + questionText + 
-                                   '<br><br><strong>Your Answer:</strong> ' + answerText;
-                    
-                    // Show alert as well for visibility
-                    setTimeout(function() {{
-                        alert('Question ' + qNum + ':\\n\\n' + questionText + '\\n\\nYour Answer: ' + answerText);
-                    }}, 50);
-                    break;
-                }}
-            }}
-        }}
-        
-        canvas.addEventListener('click', handleInteraction);
-        canvas.addEventListener('touchend', handleInteraction);
-        canvas.addEventListener('touchstart', function(e) {{ e.preventDefault(); }});
-        
-        // Initial draw
-        drawGraph();
-    </script>
-</body>
-</html>"""
-        return html
+        parts = _GRAPH_HTML_SLICES
+        return ''.join((
+            parts[0], questions_js,
+            parts[1], nodes_js,
+            parts[2], contradictions_js,
+            parts[3], requirements_js,
+            parts[4],
+        ))
     
     def _create_clickable_graph_html(self, node_positions: List[Tuple[float, float]]) -> str:
         """Create a simple HTML file (placeholder)"""
@@ -1087,47 +1503,46 @@ class SurveyApp(toga.App):
         if self.controller is None:
             return
         
-        question_data = self.controller.question_set[question_index]
-        question_text = question_data['text']
-        
-        key = self.controller._key_for(question_index)
-        answered = key in self.controller.answers
+        question_text = self.controller.texts[question_index]
         
-        if answered:
-            agreed = self.controller.answers[key][1]
-            answer_text = "Agree" if agreed else "Disagree"
-        else:
-            answer_text = "Not answered"
+        key = self.controller.keys[question_index]
+        entry = self.controller.answers.get(key)
+        state = 0 if entry is None else (2 if entry[1] else 1)
+        answer_text = _STATUS[state][1]
         
         # Create dialog content
-        dialog_content = f"Question {question_index + 1}:\n\n{question_text}\n\nYour Answer: {answer_text}"
+        dialog_content = f"{question_label(question_index)}:\n\n{question_text}\n\nYour Answer: {answer_text}"
         
         # Show dialog
         self.main_window.info_dialog(
-            f"Question {question_index + 1}",
+            question_label(question_index),
             dialog_content
         )
     
     def _generate_graph_image(self) -> Optional[Tuple[Path, List[Tuple[float, float]]]]:
         """Generate a graph visualization image using Pillow
         Returns: (image_path, node_positions) or None
+        The result is cached while answers are unchanged, so repeat
+        displays skip the Pillow render and PNG encode entirely.
         """
         if self.controller is None:
             return None
-        
+
+        cache_key = self._graph_state_key()
+        cached = self._graph_cache_result
+        if cache_key == self._graph_cache_key and cached is not None and cached[0].exists():
+            return cached
+
         try:
-            # Prepare data
+            # Prepare data; keys and answers hoisted so each node costs a
+            # single .get()
             nodes = []
-            for i in range(len(self.controller.question_set)):
-                key = self.controller._key_for(i)
-                answered = key in self.controller.answers
-                agreed = False
-                if answered:
-                    agreed = self.controller.answers[key][1]
+            answers = self.controller.answers
+            for key in self.controller.keys:
+                entry = answers.get(key)
                 nodes.append({
-                    'index': i,
-                    'answered': answered,
-                    'agreed': agreed
+                    'answered': entry is not None,
+                    'agreed': bool(entry[1]) if entry is not None else False,
                 })
             
             contradictions = self.controller.detect_contradictions()
@@ -1146,58 +1561,39 @@ class SurveyApp(toga.App):
             img = Image.new('RGB', (width, height), color='white')
             draw = ImageDraw.Draw(img)
             
-            # Calculate node positions in circle
+            # Calculate node positions in circle (memoised per layout)
             num_nodes = len(self.controller.question_set)
-            node_positions = []
-            
-            for i in range(num_nodes):
-                angle = 2 * math.pi * i / num_nodes - math.pi / 2
-                x = center_x + radius * math.cos(angle)
-                y = center_y + radius * math.sin(angle)
-                node_positions.append((x, y))
-            
-            # Draw connections first (so they appear behind nodes)
-            # Draw contradictions in red
-            for i, j, _, _ in contradictions:
-                if i < len(node_positions) and j < len(node_positions):
-                    x1, y1 = node_positions[i]
-                    x2, y2 = node_positions[j]
-                    draw.line([(x1, y1), (x2, y2)], fill='#d32f2f', width=5)
-            
-            # Draw requirements in green
-            for i, j, _, _ in requirements:
-                if i < len(node_positions) and j < len(node_positions):
-                    x1, y1 = node_positions[i]
-                    x2, y2 = node_positions[j]
-                    draw.line([(x1, y1), (x2, y2)], fill='#388e3c', width=5)
+            node_positions = list(_circle_positions(num_nodes, center_x, center_y, radius))
+
+            # Draw connections first (so they appear behind nodes); collect
+            # each colour's segments up front so the draw loop is branch-free
+            contradiction_lines = [
+                (node_positions[i], node_positions[j])
+                for i, j, _, _ in contradictions
+                if i < num_nodes and j < num_nodes
+            ]
+            requirement_lines = [
+                (node_positions[i], node_positions[j])
+                for i, j, _, _ in requirements
+                if i < num_nodes and j < num_nodes
+            ]
+            # Contradictions in red, requirements in green
+            for segments, color in ((contradiction_lines, '#d32f2f'),
+                                    (requirement_lines, '#388e3c')):
+                for p1, p2 in segments:
+                    draw.line([p1, p2], fill=color, width=5)
             
-            # Try to load a font, fall back to default if not available
-            try:
-                font = ImageFont.truetype("Arial.ttf", 16)
-                bold_font = ImageFont.truetype("Arial Bold.ttf", 16)
-            except:
-                try:
-                    font = ImageFont.load_default()
-                    bold_font = font
-                except:
-                    font = None
-                    bold_font = None
+            # Fonts are loaded once per process, not per render
+            font, bold_font = _graph_fonts()
             
             # Draw nodes
             for i, (x, y) in enumerate(node_positions):
                 node = nodes[i]
                 
-                # Node color based on status
-                if not node['answered']:
-                    fill_color = (224, 224, 224)  # Light gray #e0e0e0
-                    outline_color = (153, 153, 153)  # #999999
-                elif node['agreed']:
-                    fill_color = (74, 144, 226)  # Blue #4a90e2
-                    outline_color = (45, 90, 160)  # #2d5aa0
-                else:
-                    fill_color = (204, 204, 204)  # Gray #cccccc
-                    outline_color = (136, 136, 136)  # #888888
-                
+                # Node color based on status (shared constant tuples)
+                state = 0 if not node['answered'] else (2 if node['agreed'] else 1)
+                fill_color, outline_color = _NODE_COLORS[state]
+
                 # Draw circle for node
                 # Pillow draws circles using ellipse with equal width/height
                 left = x - node_radius
@@ -1209,7 +1605,7 @@ class SurveyApp(toga.App):
                 draw.ellipse([left, top, right, bottom], fill=fill_color, outline=outline_color, width=3)
                 
                 # Draw question number text
-                text = f'Q{i+1}'
+                text = q_label(i)
                 # Get text size to center it
                 if font:
                     bbox = draw.textbbox((0, 0), text, font=bold_font or font)
@@ -1227,15 +1623,18 @@ class SurveyApp(toga.App):
             # Save to file
             image_path = self.paths.data / 'truthweb_graph.png'
             image_path.parent.mkdir(parents=True, exist_ok=True)
-            img.save(image_path, 'PNG')
+            # Fast zlib level: encoding dominates this method's cost and the
+            # mostly-white UI graphic barely grows at level 1
+            img.save(image_path, 'PNG', compress_level=1, optimize=False)
             
             # Return both image path and node positions for click handling
-            return (image_path, node_positions)
+            result = (image_path, node_positions)
+            self._graph_cache_key = cache_key
+            self._graph_cache_result = result
+            return result
             
-        except Exception as e:
-            print(f"Error generating graph: {e}")
-            import traceback
-            traceback.print_exc()
+        except Exception:
+            logger.exception("Error generating graph")
             return None
 
 
@@ -1,4 +1,4 @@
-from typing import TypedDict
+from typing import NamedTuple, TypedDict
 
 
 class QuestionData(TypedDict):
@@ -7,6 +7,20 @@ class QuestionData(TypedDict):
     requires: list[int]  # 0-based indices of questions this requires
 
 
+class QuestionSet(NamedTuple):
+    """Struct-of-arrays view of a question set: parallel tuples indexed by
+    question number, with frozenset edges for O(1) membership tests and
+    flat edge-pair tuples for the detection scans."""
+    texts: tuple[str, ...]
+    contradicts: tuple[frozenset[int], ...]
+    requires: tuple[frozenset[int], ...]
+    # Canonical (i, j) contradiction pairs with i < j; the authoring format
+    # lists each contradiction on both endpoints, so this halves the scan
+    contradict_pairs: tuple[tuple[int, int], ...]
+    # Directed (i, j) requirement pairs, packed flat the same way
+    require_pairs: tuple[tuple[int, int], ...]
+
+
 QUESTION_SETS: dict[str, list[QuestionData]] = {
     "Superheroes": [
         {
@@ -115,4 +129,29 @@ QUESTION_SETS: dict[str, list[QuestionData]] = {
 }
 
 
+def _to_soa(questions: list[QuestionData]) -> QuestionSet:
+    return QuestionSet(
+        texts=tuple(q["text"] for q in questions),
+        contradicts=tuple(frozenset(q["contradicts"]) for q in questions),
+        requires=tuple(frozenset(q["requires"]) for q in questions),
+        contradict_pairs=tuple(sorted({
+            (min(i, j), max(i, j))
+            for i, q in enumerate(questions)
+            for j in q["contradicts"]
+        })),
+        require_pairs=tuple(
+            (i, j)
+            for i, q in enumerate(questions)
+            for j in q["requires"]
+        ),
+    )
+
+
+# Built once at import; the dict-of-TypedDicts above stays the authoring
+# format, the SoA view is what the hot loops read
+QUESTION_SETS_SOA: dict[str, QuestionSet] = {
+    name: _to_soa(questions) for name, questions in QUESTION_SETS.items()
+}
+
+
 
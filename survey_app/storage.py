@@ -1,40 +1,85 @@
 import json
 import os
 import tempfile
+import zlib
 from pathlib import Path
-from typing import Dict, List
+from typing import Dict, List, Optional, Tuple
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 
 AnswersDict = Dict[str, List[object]]  # {"q1": [question: str, value: bool], ...}
 
 
-def load_answers(path: Path) -> AnswersDict:
+def load_responses(path: Path) -> Tuple[AnswersDict, Optional[int]]:
+    """
+    Load answers plus the persisted next-question index, if present.
+
+    Understands both the current {"answers": {...}, "next_index": k} schema
+    and legacy files that are a flat answers dict (next_index is None then).
+    """
     try:
-        if not path.exists():
-            return {}
-        with path.open("r", encoding="utf-8") as f:
-            data = json.load(f)
+        # One read syscall; a missing file surfaces as FileNotFoundError
+        # rather than a separate exists() stat
+        raw = path.read_bytes()
+        data = orjson.loads(raw) if orjson is not None else json.loads(raw)
         # Basic validation to ensure expected structure
         if not isinstance(data, dict):
-            return {}
-        return data  # type: ignore[return-value]
+            return {}, None
+        if isinstance(data.get("answers"), dict):
+            next_index = data.get("next_index")
+            if not isinstance(next_index, int):
+                next_index = None
+            return data["answers"], next_index
+        # Legacy flat schema
+        return data, None  # type: ignore[return-value]
     except Exception:
         # Corrupt or unreadable; start fresh
-        return {}
+        return {}, None
+
+
+def load_answers(path: Path) -> AnswersDict:
+    return load_responses(path)[0]
 
 
-def save_answers(path: Path, answers: AnswersDict) -> None:
+def _encode(payload: dict) -> bytes:
+    # orjson serialises small dicts several times faster than stdlib json;
+    # fall back when it isn't installed
+    if orjson is not None:
+        return orjson.dumps(payload, option=orjson.OPT_INDENT_2)
+    return json.dumps(payload, ensure_ascii=False, indent=2).encode("utf-8")
+
+
+# CRC of the last payload written per path; lets redundant saves skip the
+# whole mkstemp/write/fsync/rename chain
+_last_saved_crc: Dict[Path, int] = {}
+
+
+def save_answers(path: Path, answers: AnswersDict, next_index: Optional[int] = None) -> None:
+    buf = _encode({"answers": answers, "next_index": next_index})
+    crc = zlib.crc32(buf)
+    if _last_saved_crc.get(path) == crc:
+        return
     path.parent.mkdir(parents=True, exist_ok=True)
     fd, tmp_path = tempfile.mkstemp(prefix="responses_", suffix=".json", dir=str(path.parent))
     try:
-        with os.fdopen(fd, "w", encoding="utf-8") as f:
-            json.dump(answers, f, ensure_ascii=False, indent=2)
+        # Pre-encoded bytes go out in one write; fsync before the atomic
+        # rename so a crash can't leave a torn file behind the new name
+        try:
+            os.write(fd, buf)
+            os.fsync(fd)
+        finally:
+            os.close(fd)
         os.replace(tmp_path, path)
-    finally:
+        _last_saved_crc[path] = crc
+    except Exception:
         try:
-            if os.path.exists(tmp_path):
-                os.remove(tmp_path)
-        except Exception:
+            os.remove(tmp_path)
+        except OSError:
             pass
+        raise
 
 